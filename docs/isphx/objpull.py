@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Refresh the cached intersphinx inventories used when ISPHX_LOCAL is set.
+
+Downloads each project's objects.inv next to this script as objects_<name>.inv
+so Sphinx builds can resolve cross-references without hitting the network.
+"""
+
+import urllib.request
+from pathlib import Path
+
+
+INVENTORIES = {
+    "python": "https://docs.python.org/3/objects.inv",
+    "pydantic": "https://docs.pydantic.dev/latest/objects.inv",
+}
+
+
+def main() -> None:
+    isphx_dir = Path(__file__).parent
+    for name, url in INVENTORIES.items():
+        dest = isphx_dir / f"objects_{name}.inv"
+        print(f"Fetching {url} -> {dest}")
+        urllib.request.urlretrieve(url, dest)
+
+
+if __name__ == "__main__":
+    main()
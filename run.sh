@@ -520,6 +520,25 @@ function tests:cov {
     uv run pytest "$TEST_FILE" --cov=src/langchain_prolog --cov-report=term "$@"
 }
 
+# Run only the fast tests, skipping those marked slow (fresh consults,
+# tmp_path file setup) for quick local iteration
+function tests:fast {
+    echo "Running fast tests..."
+    TEST_FILE="${1:-$(get:python:files:tests)}"
+    shift || true
+    uv run pytest "$TEST_FILE" -m "not slow" "$@"
+}
+
+# Run tests in parallel across CPU cores. --dist loadfile keeps each test
+# file on one worker so module-scoped Prolog fixtures are consulted once
+# per worker instead of once per test
+function tests:parallel {
+    echo "Running tests in parallel..."
+    TEST_FILE="${1:-$(get:python:files:tests)}"
+    shift || true
+    uv run pytest "$TEST_FILE" -n auto --dist loadfile "$@"
+}
+
 # Run tests in verbose mode
 function tests:verbose {
     echo "Running tests in verbose mode..."
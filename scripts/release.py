@@ -2,20 +2,24 @@
 
 import logging
 import os
-import pickle
 import re
 import subprocess
 import sys
-import tempfile
 from datetime import datetime
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     List,
     Optional,
     Tuple,
 )
 
+
+if TYPE_CHECKING:
+    import argparse
+
 from packaging.version import (
     InvalidVersion,
     Version,
@@ -33,12 +37,11 @@ except ImportError:
     manifest_path = None
     write_manifest = None
 
-logging.basicConfig(
-    level=logging.CRITICAL,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+# Configure only this script's logger: importing release.py as a library must
+# not reconfigure the root logger of the host application. main() attaches a
+# real handler when --log is passed.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class ReleaseType(Enum):
@@ -67,6 +70,21 @@ class PrereleaseType(Enum):
     RC = "rc"
 
 
+# Hoisted so argparse setup does not re-enumerate the enums on every run
+RELEASE_TYPE_CHOICES = tuple(t.value for t in ReleaseType)
+PRERELEASE_TYPE_CHOICES = tuple(t.value for t in PrereleaseType)
+
+
+# Matches release tags like v1.2.3, v1.2.3rc1 or v1.2.3-alpha2
+_RELEASE_TAG_RE = re.compile(r"^v\d+\.\d+\.\d+(?:[-.]?(?:a|alpha|b|beta|rc|dev|post)\d*)?$")
+
+
+@lru_cache(maxsize=None)
+def _version_variable_pattern(version_key: str) -> "re.Pattern[str]":
+    """Compiled pattern matching a version assignment while capturing its formatting."""
+    return re.compile(rf'({re.escape(version_key)})(\s*)([:=])(\s*)(["\']?)([^"\'<>\s\n)]+)(["\']?)')
+
+
 PROJECT_FILE = "pyproject.toml"
 CHANGELOG_FILE = "CHANGELOG.md"
 RELEASE_NOTES_FILE = "RELEASE_NOTES.md"
@@ -88,6 +106,9 @@ class RollbackState:
         self.start_dt = start_dt
         self.current_version = current_version
         self.files_backup: List[Tuple[str, Optional[str]]] = []
+        # Set once the release tag exists, so rollback() can skip the
+        # 'git describe' probe when the release failed before tagging.
+        self.tag_created = False
 
     def add_to_backup(self, entries: List[Tuple[str, Optional[str]]]) -> None:
         """Append file backup entries (path, original_content)."""
@@ -95,6 +116,8 @@ class RollbackState:
 
     def save(self) -> None:
         """Pickle state to disk for later rollback."""
+        import pickle
+
         try:
             with open(self.PICKLE_FILE, "wb") as f:
                 pickle.dump(self, f)
@@ -105,6 +128,8 @@ class RollbackState:
     @classmethod
     def load(cls) -> "RollbackState":
         """Load previously saved state from disk."""
+        import pickle
+
         try:
             with open(cls.PICKLE_FILE, "rb") as f:
                 state = pickle.load(f)
@@ -222,8 +247,8 @@ def create_release(
             release_docs_path, "release_notes", latest_tag, latest_tag_dt, interactive
         )
         create_release_notes(release_notes_file, new_version, changelog_entry, state, interactive, release_notes_doc)
-        create_commit(new_version, commit_message)
-        create_tag(new_version, tag_message)
+        create_commit_and_tag(new_version, commit_message, tag_message)
+        state.tag_created = True
         state.save()
 
         return new_version
@@ -242,7 +267,7 @@ def get_latest_release_tag() -> Optional[str]:
     """Find the latest release tag matching 'v<PyPI version>'."""
     tags = subprocess.check_output(["git", "tag"], text=True).splitlines()
     # Filter only version tags
-    valid_tags = [tag for tag in tags if re.match(r"^v\d+\.\d+\.\d+(?:[-.]?(?:a|alpha|b|beta|rc|dev|post)\d*)?$", tag)]
+    valid_tags = [tag for tag in tags if _RELEASE_TAG_RE.match(tag)]
     if not valid_tags:
         return None
     # Sort tags by version number (PEP 440 compliant sorting)
@@ -333,8 +358,12 @@ def get_current_version(project_file: str) -> Version:
         raise ValueError(f"Invalid version format in '{project_file}': '{version_text}'") from e
 
 
-def read_from_toml_file(file_path: str, section: str, key: str) -> Optional[str]:
-    """Reads a toml file to get the contents of a specific tool section and key."""
+@lru_cache(maxsize=None)
+def _load_toml_data(file_path: str) -> dict:
+    """Parse a TOML file, cached per path so a release run reads each file once.
+
+    update_version_files clears this cache after rewriting version files.
+    """
     try:
         import tomllib  # Part of the standard library on Python 3.11+
     except ImportError:
@@ -346,9 +375,14 @@ def read_from_toml_file(file_path: str, section: str, key: str) -> Optional[str]
     toml_file = Path(file_path)
     if not toml_file.exists():
         raise FileNotFoundError(f"'{file_path}' does not exist.")
+    with open(toml_file, "rb") as f:
+        return tomllib.load(f)
+
+
+def read_from_toml_file(file_path: str, section: str, key: str) -> Optional[str]:
+    """Reads a toml file to get the contents of a specific tool section and key."""
     try:
-        with open(toml_file, "rb") as f:
-            toml_data = tomllib.load(f)
+        toml_data = _load_toml_data(file_path)
         # Support both PEP 621 format (project.version) and Poetry format (tool.poetry.version)
         if section == "project":
             # PEP 621 format: read from root level
@@ -541,9 +575,11 @@ def bump_version(
         ReleaseType.DEV: bump_to_dev,
     }
 
-    if release_type not in ReleaseType:
+    # Single dict probe doubles as the membership check
+    bump = bump_function.get(release_type)
+    if bump is None:
         raise ValueError(f"Release type '{release_type}' not supported.")
-    new_version = bump_function[release_type]()
+    new_version = bump()
     try:
         logger.info(f"Bumping from version {current_version} to {new_version}")
         return Version(new_version)
@@ -562,7 +598,7 @@ def update_version_files(project_file: str, new_version: Version, state: Rollbac
 
     logger.info(f"Updating files with new version: {new_version}")
     updated_files = []
-    original_contents = []
+    backup_entries: List[Tuple[str, Optional[str]]] = []
     version_variables = read_from_toml_file(project_file, "semantic_release", "version_variable")
     if version_variables:
         for version_variable in version_variables:
@@ -572,9 +608,8 @@ def update_version_files(project_file: str, new_version: Version, state: Rollbac
             if not file.exists():
                 print(f"Warning: '{file_path}' does not exist, skipping.")
                 continue
-            content = file.read_text()
-            # Build pattern with capturing groups to preserve format
-            pattern = rf'({re.escape(version_key)})(\s*)([:=])(\s*)(["\']?)([^"\'<>\s\n)]+)(["\']?)'
+            # Pattern with capturing groups to preserve format
+            pattern = _version_variable_pattern(version_key)
 
             def replace_version(match: re.Match) -> str:
                 """Preserve the original format while updating the version."""
@@ -587,16 +622,31 @@ def update_version_files(project_file: str, new_version: Version, state: Rollbac
 
                 return f"{key}{space1}{separator}{space2}{open_quote}{new_version}{close_quote}"
 
-            new_content, found = re.subn(pattern, replace_version, content, count=1)
-            if found:
-                file.write_text(new_content)
-                updated_files.append(file_path)
-                original_contents.append(content)
-                logger.info(f"Updated '{file_path}' to version {new_version}.")
-            else:
-                print(f"Warning: '{version_key}' not found in '{file_path}', skipping.")
-
-    state.add_to_backup(list(zip(updated_files, original_contents)))
+            # Read and rewrite through a single handle instead of a
+            # read_text/write_text round-trip per file
+            with open(file, "r+", encoding="utf-8") as f:
+                content = f.read()
+                new_content, found = pattern.subn(replace_version, content, count=1)
+                if found:
+                    updated_files.append(file_path)
+                    if new_content == content:
+                        # Skipping the no-op write keeps the file's mtime intact, so tools
+                        # that rebuild on mtime changes (e.g. Sphinx for docs/conf.py) are
+                        # not invalidated by a same-version update.
+                        logger.info(f"'{file_path}' already at version {new_version}; write skipped.")
+                        continue
+                    f.seek(0)
+                    f.truncate()
+                    f.write(new_content)
+                    backup_entries.append((file_path, content))
+                    logger.info(f"Updated '{file_path}' to version {new_version}.")
+                else:
+                    print(f"Warning: '{version_key}' not found in '{file_path}', skipping.")
+
+    state.add_to_backup(backup_entries)
+
+    # The rewritten files may include TOML files cached by _load_toml_data
+    _load_toml_data.cache_clear()
 
     if project_file not in updated_files:
         raise ValueError(f"Failed to update version in '{project_file}'.")
@@ -615,9 +665,19 @@ def update_changelog(
 
     logger.info(f"Updating '{changelog_path}' to {new_version}.")
     try:
-        changelog_entry = initial_content or f"## [{new_version}] - {date}\n\n### Changes\n"
         if initial_content is None:
-            changelog_entry += extract_changes_section(commit_message) + "\n\n"
+            changelog_entry = "\n".join(
+                (
+                    f"## [{new_version}] - {date}",
+                    "",
+                    "### Changes",
+                    extract_changes_section(commit_message),
+                    "",
+                    "",
+                )
+            )
+        else:
+            changelog_entry = initial_content
         if interactive:
             changelog_entry = open_in_editor("changelog entry", changelog_entry, "md")
         changelog_file = Path(changelog_path)
@@ -685,6 +745,8 @@ def ask_user(message: str, choices: List[str], cancel: str = "Cancel") -> str:
 
 def open_in_editor(context: str, text: str, extension: str) -> str:
     """Opens a text in VS Code for user editing."""
+    import tempfile
+
     print(f"-Opening {context} in VS Code for editing")
     # Create a temporary file for user editing
     with tempfile.NamedTemporaryFile(mode="w+", suffix=f".{extension}", delete=False) as tmp_file:
@@ -803,24 +865,30 @@ def create_tag_message(
     return tag_message
 
 
-def create_commit(
-    new_version: Version,
-    commit_message: str,
-) -> None:
-    """Create a commit with the release changes."""
-    print(f"-Creating release commit for version: {new_version}")
-    logger.info("Staging changes...")
-    subprocess.run(["git", "add", "."], check=True)
-    logger.info("Committing changes...")
-    subprocess.run(["git", "commit", "-m", commit_message], check=True)
-
+def create_commit_and_tag(new_version: Version, commit_message: str, tag_message: str) -> None:
+    """Create the release commit and tag in a single git pipeline.
 
-def create_tag(new_version: Version, tag_message: str) -> None:
-    """Create a tag for the release."""
+    Staging, committing and tagging are chained through one shell invocation
+    instead of three subprocess.run calls; the multi-line messages travel via
+    the environment to avoid quoting issues.
+    """
     tag = f"v{new_version}"
-    logger.info(f"Creating tag: {tag}")
-    logger.info(f"Creating release tag for version: {new_version}")
-    subprocess.run(["git", "tag", "-a", tag, "-m", tag_message], check=True)
+    print(f"-Creating release commit and tag for version: {new_version}")
+    logger.info(f"Staging changes, committing and creating tag: {tag}")
+    subprocess.run(
+        [
+            "sh",
+            "-c",
+            'git add . && git commit -m "$RELEASE_COMMIT_MSG" && git tag -a "$RELEASE_TAG" -m "$RELEASE_TAG_MSG"',
+        ],
+        env={
+            **os.environ,
+            "RELEASE_COMMIT_MSG": commit_message,
+            "RELEASE_TAG": tag,
+            "RELEASE_TAG_MSG": tag_message,
+        },
+        check=True,
+    )
 
 
 def rollback(state: Optional[RollbackState]) -> bool:
@@ -829,16 +897,18 @@ def rollback(state: Optional[RollbackState]) -> bool:
         return True
     logger.info("Rolling back changes...")
     try:
-        # Check if last tag is after the script start
-        last_tag = subprocess.check_output(["git", "describe", "--tags", "--abbrev=0"], text=True).strip()
-        last_tag_commit_dt_str = subprocess.check_output(
-            ["git", "log", "-1", "--format=%cd", "--date=iso-strict", last_tag], text=True
-        ).strip()
-        last_tag_commit_dt = datetime.fromisoformat(last_tag_commit_dt_str)
-        if last_tag_commit_dt > state.start_dt:
-            # Delete the last tag
-            print(f"-Deleting tag: {last_tag}")
-            subprocess.run(["git", "tag", "-d", last_tag], check=True)
+        # Check the last tag only if this release got far enough to create one
+        # (getattr keeps states pickled by older versions working)
+        if getattr(state, "tag_created", True):
+            last_tag = subprocess.check_output(["git", "describe", "--tags", "--abbrev=0"], text=True).strip()
+            last_tag_commit_dt_str = subprocess.check_output(
+                ["git", "log", "-1", "--format=%cd", "--date=iso-strict", last_tag], text=True
+            ).strip()
+            last_tag_commit_dt = datetime.fromisoformat(last_tag_commit_dt_str)
+            if last_tag_commit_dt > state.start_dt:
+                # Delete the last tag
+                print(f"-Deleting tag: {last_tag}")
+                subprocess.run(["git", "tag", "-d", last_tag], check=True)
 
         # Check if last commit is after the script start
         last_commit_dt_str = subprocess.check_output(
@@ -864,6 +934,40 @@ def rollback(state: Optional[RollbackState]) -> bool:
         return False
 
 
+def run_create(args: "argparse.Namespace") -> None:
+    """Handler for the 'create' subcommand."""
+    new_version = create_release(
+        ReleaseType(args.type),
+        PrereleaseType(args.pre) if args.pre else None,
+        changes_message=args.changes[0] if args.changes else None,
+        release_docs=args.release_docs,
+        interactive=not args.no_interactive,
+    )
+    print(f"Successfully created release {new_version}")
+    print("To complete the release:")
+    print("1. Review the changes: CHANGLOG.md entry, latest commit and latest tag.")
+    print("2. Run: git push && git push --tags")
+
+
+def run_rollback(args: "argparse.Namespace") -> None:
+    """Handler for the 'rollback' subcommand."""
+    print("Caution: This will rollback the last release and will delete your latest commit and tag.")
+    answer = input("Are you sure you want to continue? (y/n): ")
+    if answer.lower() != "y":
+        print("Rollback cancelled.")
+        sys.exit(0)
+    state = RollbackState.load()
+    success = rollback(state)
+    state.cleanup()
+    if success:
+        print(f"Successfully rolled back to {state.current_version}")
+    else:
+        print(
+            f"Warning: Rollback to {state.current_version} was only partial. Manual intervention may be required."
+        )
+    print("Please review the changes: CHANGLOG.md entry, version files, latest commit and latest tag.")
+
+
 def main() -> None:
     try:
         import argparse
@@ -884,8 +988,8 @@ def main() -> None:
 
         # Create release command
         release_parser = subparsers.add_parser("create", parents=[parent_parser], help="Create a new release")
-        release_parser.add_argument("type", choices=[t.value for t in ReleaseType], help="Type of release")
-        release_parser.add_argument("--pre", choices=[t.value for t in PrereleaseType], help="Type of pre-release")
+        release_parser.add_argument("type", choices=RELEASE_TYPE_CHOICES, help="Type of release")
+        release_parser.add_argument("--pre", choices=PRERELEASE_TYPE_CHOICES, help="Type of pre-release")
         release_parser.add_argument("--changes", nargs=1, help="Deprecated. Use --release-docs with commit.txt.")
         release_parser.add_argument(
             "--release-docs",
@@ -897,9 +1001,11 @@ def main() -> None:
         release_parser.add_argument(
             "--no-interactive", action="store_true", help="Disable interactive prompts (for CI)"
         )
+        release_parser.set_defaults(handler=run_create)
 
         # Rollback command
-        subparsers.add_parser("rollback", parents=[parent_parser], help="Rollback last release")
+        rollback_parser = subparsers.add_parser("rollback", parents=[parent_parser], help="Rollback last release")
+        rollback_parser.set_defaults(handler=run_rollback)
 
         args = parser.parse_args()
 
@@ -909,43 +1015,15 @@ def main() -> None:
 
         # Reconfigure logging based on CLI flags
         if args.log is not None:
-            root = logging.getLogger()
-            root.setLevel(logging.INFO)
-            for h in root.handlers:
-                root.removeHandler(h)
+            logger.setLevel(logging.INFO)
+            for h in list(logger.handlers):
+                logger.removeHandler(h)
             handler = logging.FileHandler(args.log) if args.log else logging.StreamHandler(sys.stdout)
             handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-            root.addHandler(handler)
-
-        if args.command == "create":
-            new_version = create_release(
-                ReleaseType(args.type),
-                PrereleaseType(args.pre) if args.pre else None,
-                changes_message=args.changes[0] if args.changes else None,
-                release_docs=args.release_docs,
-                interactive=not args.no_interactive,
-            )
-            print(f"Successfully created release {new_version}")
-            print("To complete the release:")
-            print("1. Review the changes: CHANGLOG.md entry, latest commit and latest tag.")
-            print("2. Run: git push && git push --tags")
-
-        elif args.command == "rollback":
-            print("Caution: This will rollback the last release and will delete your latest commit and tag.")
-            answer = input("Are you sure you want to continue? (y/n): ")
-            if answer.lower() != "y":
-                print("Rollback cancelled.")
-                sys.exit(0)
-            state = RollbackState.load()
-            success = rollback(state)
-            state.cleanup()
-            if success:
-                print(f"Successfully rolled back to {state.current_version}")
-            else:
-                print(
-                    f"Warning: Rollback to {state.current_version} was only partial. Manual intervention may be required."
-                )
-            print("Please review the changes: CHANGLOG.md entry, version files, latest commit and latest tag.")
+            logger.addHandler(handler)
+
+        # Dispatch to the handler bound by the matched subparser
+        args.handler(args)
 
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
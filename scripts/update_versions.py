@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -10,6 +11,32 @@ except ImportError:
     import tomli as tomllib  # For Python < 3.11
 
 
+@lru_cache(maxsize=None)
+def _version_pattern(var_name: str) -> "re.Pattern[str]":
+    """Compiled pattern matching a version assignment while capturing its formatting."""
+    return re.compile(rf'({re.escape(var_name)})(\s*)([:=])(\s*)(["\']?)([^"\'<>\s\n)]+)(["\']?)')
+
+
+def _substitute_in_place(path: Path, pattern: "re.Pattern[str]", repl) -> "bool | None":
+    """Apply a single substitution through one open file handle.
+
+    Returns None when the pattern is not found, False when the replacement
+    leaves the content unchanged (so no write happens and the mtime is
+    preserved), and True when the file was rewritten in place.
+    """
+    with open(path, "r+", encoding="utf-8") as f:
+        content = f.read()
+        new_content, found = pattern.subn(repl, content, count=1)
+        if not found:
+            return None
+        if new_content == content:
+            return False
+        f.seek(0)
+        f.truncate()
+        f.write(new_content)
+        return True
+
+
 def update_files(new_version: str, dry_run: bool = False) -> None:
     """Update version variables in specified files based on pyproject.toml configuration."""
 
@@ -44,19 +71,24 @@ def update_files(new_version: str, dry_run: bool = False) -> None:
             print(f"Warning: {file_path} not found, skipping.")
             continue
 
-        content = path.read_text()
-        pattern = rf'({re.escape(var_name)})(\s*)([:=])(\s*)(["\']?)([^"\'<>\s\n)]+)(["\']?)'
-        new_content, found = re.subn(pattern, replace_version, content, count=1)
-        if not found:
-            print(f"Warning: Pattern for {var_name} not found in {file_path}, skipping.")
+        pattern = _version_pattern(var_name)
+        if dry_run:
+            match = pattern.search(path.read_text())
+            if not match:
+                print(f"Warning: Pattern for {var_name} not found in {file_path}, skipping.")
+                continue
+            print(f"DRYRUN: {file_path} would be updated to {replace_version(match)}")
             continue
 
-        if dry_run:
-            new_line = replace_version(re.search(pattern, new_content))  # type: ignore
-            print(f"DRYRUN: {file_path} would be updated to {new_line}")
-        else:
-            path.write_text(new_content)
+        changed = _substitute_in_place(path, pattern, replace_version)
+        if changed is None:
+            print(f"Warning: Pattern for {var_name} not found in {file_path}, skipping.")
+        elif changed:
             print(f"UPDATED: {file_path}")
+        else:
+            # Avoid bumping the mtime when the version is already current, so
+            # mtime-based caches (e.g. Sphinx's pickled environment) stay valid.
+            print(f"UNCHANGED: {file_path}")
 
 
 if __name__ == "__main__":
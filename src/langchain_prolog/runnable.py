@@ -1,4 +1,8 @@
 __all__ = ["PrologConfig", "PrologInput", "PrologSolution", "PrologResult", "PrologRunnable"]
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib import resources
 from pathlib import Path
 from typing import (
@@ -52,6 +56,40 @@ set_verbose(False)
 set_debug(False)
 set_llm_cache(None)
 
+# All asynchronous entry points funnel Prolog work through one dedicated worker
+# thread: janus attaches a Prolog engine per OS thread, so a single long-lived
+# thread amortizes engine attachment and serializes access to the shared
+# knowledge base instead of paying both costs on every call.
+_PROLOG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="langchain-prolog")
+
+# Pydantic models built by PrologRunnable.create_schema, memoized per
+# (predicate, argument names) so repeated calls reuse one model class
+_SCHEMA_CACHE: Dict[Tuple[str, Tuple[str, ...]], Type[BaseModel]] = {}
+
+# Goal template per schema class: predicate name plus (field, Prolog variable)
+# pairs, so model-based queries skip per-call class introspection
+_GOAL_TEMPLATE_CACHE: Dict[Type[BaseModel], Tuple[str, Tuple[Tuple[str, str], ...]]] = {}
+
+
+def _goal_template(model_cls: Type[BaseModel]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    template = _GOAL_TEMPLATE_CACHE.get(model_cls)
+    if template is None:
+        template = (
+            model_cls.__name__,
+            tuple((name, name.capitalize()) for name in model_cls.model_fields),
+        )
+        _GOAL_TEMPLATE_CACHE[model_cls] = template
+    return template
+
+
+# Whether consult_ex.pl has been consulted into the process-wide engine
+_CONSULT_EX_LOADED = False
+
+# Rules files already consulted into the process-wide engine, keyed by
+# resolved path with the file mtime observed at consult time; an unchanged
+# file is not re-consulted since its clauses are still loaded
+_CONSULTED_RULES: Dict[str, float] = {}
+
 PrologInput = Optional[Union[str, Dict[Any, Any], BaseModel]]
 PrologSolution = Dict[Any, Any]
 PrologResult = Union[Literal[True], Literal[False], List[PrologSolution], PrologRuntimeError]
@@ -80,12 +118,24 @@ class PrologConfig(BaseModel):
         arbitrary_types_allowed=True,
     )
     rules_file: Optional[Union[str, Path]] = Field(default=None, description="Path to the Prolog rules file")
+    rules_text: Optional[str] = Field(
+        default=None,
+        description="Prolog rules source consulted directly from memory, without a rules file",
+    )
     default_predicate: Optional[str] = Field(
         default=None,
         description="Default predicate to use when no predicate is specified",
     )
     query_schema: Optional[Type[BaseModel]] = Field(default=None, description="Pydantic model for input validation")
     prolog_flags: Dict[str, Any] = Field(default_factory=dict, description="Custom Prolog flags to set")
+    cache_failed_queries: bool = Field(
+        default=False,
+        description=(
+            "Cache goals that failed so repeated known-failing queries skip Prolog execution. "
+            "Only enable for static knowledge bases: facts asserted after a failure are not "
+            "seen by cached queries (loading a rules file clears the cache)"
+        ),
+    )
 
     @field_validator("rules_file", mode="before")
     def validate_rules_file(cls, v: Optional[Union[str, Path]]) -> Optional[Path]:
@@ -129,6 +179,11 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     _prolog_config: PrologConfig = PrivateAttr()
 
+    # Bound for the per-instance built-query cache; cleared wholesale when hit
+    _QUERY_CACHE_MAX = 1024
+    # Bound for the per-instance failed-query cache, same clear-on-full policy
+    _FAILED_QUERIES_MAX = 512
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         prolog_config: Optional[Union[PrologConfig, Dict]] = None,
@@ -164,6 +219,11 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             prolog_config = PrologConfig()
 
         self._prolog_config = prolog_config.model_copy()
+        # Built queries keyed by (default_predicate, input string), so repeated
+        # invocations of the same query skip validation and string assembly
+        self._query_cache: Dict[Tuple[Optional[str], str], str] = {}
+        # Goals known to fail; consulted only when cache_failed_queries is set
+        self._failed_queries: set = set()
 
         # Set Prolog flags
         for flag, value in prolog_config.prolog_flags.items():
@@ -172,17 +232,24 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             except Exception as e:
                 raise PrologRuntimeError(f"Error setting Prolog flag {flag} to {value}: {str(e)}")
 
-        # Load the consult_ex module
-        try:
-            with resources.files("langchain_prolog").joinpath("consult_ex.pl").open("r") as f:
-                consult_ex_path = Path(f.name)
-                janus.consult(str(consult_ex_path))
-        except Exception as e:
-            raise PrologRuntimeError(f"Error loading Prolog consult_ex module: {str(e)}")
+        # Load the consult_ex module. janus wraps one process-wide SWI-Prolog
+        # engine, so the module only needs consulting once; later instances
+        # skip the resource lookup and consult entirely
+        global _CONSULT_EX_LOADED
+        if not _CONSULT_EX_LOADED:
+            try:
+                with resources.files("langchain_prolog").joinpath("consult_ex.pl").open("r") as f:
+                    consult_ex_path = Path(f.name)
+                    janus.consult(str(consult_ex_path))
+            except Exception as e:
+                raise PrologRuntimeError(f"Error loading Prolog consult_ex module: {str(e)}")
+            _CONSULT_EX_LOADED = True
 
-        # Load rules file if specified
+        # Load rules file and/or in-memory rules if specified
         if prolog_config.rules_file:
             self.load_rules(prolog_config.rules_file)
+        if prolog_config.rules_text:
+            self.load_rules_text(prolog_config.rules_text)
 
         self.verbose = verbose or get_verbose()
         self.callbacks = callbacks
@@ -199,12 +266,19 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
         """Get the Prolog configuration."""
         return self._prolog_config
 
-    def load_rules(self, rules_file: Union[str, Path]) -> None:
+    def load_rules(self, rules_file: Union[str, Path], force: bool = False) -> None:
         """
         Load Prolog rules from a file.
 
+        A file that has already been consulted and has not changed since
+        (same resolved path and mtime) is not re-consulted, unless force is
+        set. Pass force=True to restore a knowledge base that was mutated at
+        runtime (assert/retract) from an unchanged file.
+
         Args:
             rules_file (str | Path): Path to the Prolog rules file
+            force (bool): Re-consult the file even if it was already loaded
+                and has not changed. Defaults to False.
 
         Raises:
             PrologFileNotFoundError: If rules_file doesn't exist
@@ -213,12 +287,41 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
         rules_path = Path(rules_file)
         if not rules_path.exists():
             raise PrologFileNotFoundError(f"Prolog rules file not found: {rules_file}")
+        # Skip the consult when this exact file content is already loaded in
+        # the process-wide engine (same resolved path, unchanged mtime)
+        resolved_path = str(rules_path.resolve())
+        mtime = rules_path.stat().st_mtime
+        if not force and _CONSULTED_RULES.get(resolved_path) == mtime:
+            return
         try:
             # Convert path to Prolog atom string (with single quotes)
             prolog_path = f"'{str(rules_path)}'"
             janus.query_once(f"consult_ex({prolog_path})")
         except Exception as e:
             raise PrologRuntimeError(f"Error loading Prolog rules: {str(e)}")
+        _CONSULTED_RULES[resolved_path] = mtime
+        # New rules can make previously failing goals succeed
+        self._failed_queries.clear()
+
+    def load_rules_text(self, rules_text: str) -> None:
+        """
+        Load Prolog rules from a source string.
+
+        Consults the rules directly from memory, so no rules file and no
+        filesystem round trip is needed.
+
+        Args:
+            rules_text (str): Prolog source text to consult
+
+        Raises:
+            PrologRuntimeError: If rules can't be loaded or have gramatical errors
+        """
+        try:
+            janus.consult("rules_text", rules_text)
+        except Exception as e:
+            raise PrologRuntimeError(f"Error loading Prolog rules: {str(e)}")
+        # New rules can make previously failing goals succeed
+        self._failed_queries.clear()
 
     @classmethod
     def create_schema(cls, predicate_name: str, arg_names: List[str]) -> Type[BaseModel]:
@@ -241,9 +344,14 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
         if not all(isinstance(name, str) and name.isidentifier() for name in arg_names):
             raise PrologValueError("All argument names must be valid Python identifiers")
 
-        fields: Dict[str, Any] = {name: (Optional[Any], ...) for name in arg_names}
+        cache_key = (predicate_name, tuple(arg_names))
+        schema = _SCHEMA_CACHE.get(cache_key)
+        if schema is None:
+            fields: Dict[str, Any] = {name: (Optional[Any], ...) for name in arg_names}
+            schema = create_model(f"{predicate_name}", __config__=ConfigDict(), **fields)
+            _SCHEMA_CACHE[cache_key] = schema
 
-        return create_model(f"{predicate_name}", __config__=ConfigDict(), **fields)
+        return schema
 
     def _process_input(self, input_data: PrologInput) -> Union[str, BaseModel]:
         """
@@ -262,10 +370,30 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             if not self._prolog_config.default_predicate:
                 raise PrologValueError("Input data cannot be None if no default predicate set")
             return self._prolog_config.default_predicate + "()"
-        if isinstance(input_data, (str, BaseModel)):
+        # Exact-type checks cover the common cases in one comparison each;
+        # schema instances are dynamically created BaseModel subclasses, so
+        # they (and str/dict subclasses) fall through to the isinstance checks
+        input_type = type(input_data)
+        if input_type is str:
             return input_data
+        if input_type is not dict:
+            if isinstance(input_data, (str, BaseModel)):
+                return input_data
         if isinstance(input_data, dict) and self._prolog_config.query_schema:
-            return self._prolog_config.query_schema(**input_data)
+            schema = self._prolog_config.query_schema
+            # When the dict supplies exactly the schema's fields, build the goal
+            # directly from the template: schema fields accept any value, so
+            # instantiating the model would only copy the dict into an object
+            # that _build_query immediately takes apart again. Key mismatches
+            # still go through the model so pydantic reports the missing fields
+            if input_data.keys() == schema.model_fields.keys():
+                predicate, field_vars = _goal_template(schema)
+                params = []
+                for field_name, variable in field_vars:
+                    value = input_data[field_name]
+                    params.append(str(value) if value is not None else variable)
+                return f"{predicate}({', '.join(params)})"
+            return schema(**input_data)
         raise PrologValueError("Invalid input type or missing schema for dictionary input")
 
     def _build_query(self, input_data: Union[str, BaseModel]) -> str:
@@ -282,6 +410,13 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             PrologValueError: If input_data is of invalid type or invalid query format
         """
         if isinstance(input_data, str):
+            # The default predicate is part of the key because it can be changed
+            # on the config after construction
+            cache_key = (self._prolog_config.default_predicate, input_data)
+            query = self._query_cache.get(cache_key)
+            if query is not None:
+                return query
+
             if not input_data.strip() and not self._prolog_config.default_predicate:
                 raise PrologValueError("Prolog query string cannot be empty")
 
@@ -290,26 +425,39 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
                 # Validate parentheses matching
                 if input_data.count("(") != input_data.count(")"):
                     raise PrologValueError("Mismatched parentheses in query")
-                return input_data
+                query = input_data
+            else:
+                # Use default predicate if no explicit predicate is provided
+                if not self._prolog_config.default_predicate:
+                    raise PrologValueError(f"No default predicate set for argument-only query: {input_data}")
+                query = f"{self._prolog_config.default_predicate}({input_data})"
 
-            # Use default predicate if no explicit predicate is provided
-            if not self._prolog_config.default_predicate:
-                raise PrologValueError(f"No default predicate set for argument-only query: {input_data}")
-            return f"{self._prolog_config.default_predicate}({input_data})"
+            if len(self._query_cache) >= self._QUERY_CACHE_MAX:
+                self._query_cache.clear()
+            self._query_cache[cache_key] = query
+            return query
 
         if isinstance(input_data, BaseModel):
             # Convert Pydantic model to Prolog query. None values are converted to Prolog variables
+            predicate, field_vars = _goal_template(type(input_data))
             params = []
-            for field_name, field_value in input_data:
-                value = field_value if field_value is not None else field_name.capitalize()
-                params.append(str(value))
-            return f"{input_data.__class__.__name__}({', '.join(params)})"
+            for field_name, variable in field_vars:
+                value = getattr(input_data, field_name)
+                params.append(str(value) if value is not None else variable)
+            return f"{predicate}({', '.join(params)})"
 
         raise PrologValueError("Input must be either string or valid Pydantic model")
 
+    # Shared empty mapping returned when no prolog_kwargs are configured; it is
+    # only ever **-unpacked by callers, so sharing one instance is safe
+    _EMPTY_PROLOG_KWARGS: Dict[str, str] = {}
+
     @staticmethod
     def _get_prolog_kwargs(config: RunnableConfig) -> Dict[str, str]:
-        return config.get("configurable", {}).get("prolog_kwargs", {})
+        configurable = config.get("configurable")
+        if not configurable:
+            return PrologRunnable._EMPTY_PROLOG_KWARGS
+        return configurable.get("prolog_kwargs", PrologRunnable._EMPTY_PROLOG_KWARGS)
 
     def _execute_query(self, query: str, **kwargs: Any) -> Iterator[Dict[Any, Any]]:
         """
@@ -339,8 +487,13 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
 
     @staticmethod
     def _clean_solution(solution: Dict[Any, Any]) -> PrologSolution:
-        """Clean a single solution dictionary."""
-        return {k: v for k, v in solution.items() if k != "truth"}
+        """Clean a single solution dictionary.
+
+        Atom bindings are interned: knowledge bases bind the same small set of
+        atoms over and over, so interning makes repeated solutions share one
+        string object and turns equality checks into pointer comparisons.
+        """
+        return {k: sys.intern(v) if type(v) is str else v for k, v in solution.items() if k != "truth"}
 
     def invoke(self, input: PrologInput, config: Optional[RunnableConfig] = None, **kwargs: Any) -> PrologResult:
         """
@@ -385,12 +538,37 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
 
             processed_input = self._process_input(input)
             query = self._build_query(processed_input)
+
+            # The failed-query cache is keyed by the goal string alone, so it
+            # is bypassed when per-call prolog_kwargs (e.g. janus inputs or
+            # truth_vals) could change the outcome for the same goal
             prolog_kwargs = self._get_prolog_kwargs(config)
+            cache_failed = self._prolog_config.cache_failed_queries and not prolog_kwargs
+            if cache_failed and query in self._failed_queries:
+                run_manager.on_chain_end({"output": False})
+                return False
+
             solutions = list(self._execute_query(query, **prolog_kwargs))
 
-            if len(solutions) == 0 or all(sol == {"truth": False} for sol in solutions):
+            # Classify the solutions in one pass instead of two all() scans:
+            # track whether every solution is a bare truth dict, stopping the
+            # checks as soon as both outcomes are ruled out
+            all_false = all_true = True
+            for sol in solutions:
+                if all_false and sol != {"truth": False}:
+                    all_false = False
+                if all_true and sol != {"truth": True}:
+                    all_true = False
+                if not (all_false or all_true):
+                    break
+
+            if not solutions or all_false:
                 result = False
-            elif all(sol == {"truth": True} for sol in solutions):
+                if cache_failed:
+                    if len(self._failed_queries) >= self._FAILED_QUERIES_MAX:
+                        self._failed_queries.clear()
+                    self._failed_queries.add(query)
+            elif all_true:
                 result = True
             else:
                 result = [self._clean_solution(sol) for sol in solutions]
@@ -428,7 +606,8 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             PrologValueError: If input type is invalid or schema is missing for a dictionay input
             PrologRuntimeError: If query execution fails
         """
-        return self.invoke(input, config=config, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_PROLOG_EXECUTOR, partial(self.invoke, input, config, **kwargs))
 
     def stream(  # noqa: R701  # pylint: disable=too-many-locals,too-many-branches
         self, input: PrologInput, config: Optional[RunnableConfig] = None, **kwargs: Any
@@ -632,7 +811,14 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             PrologValueError: If inputs is not a list
             PrologRuntimeError: If execution fails and return_exceptions is False
         """
-        return self.batch(inputs, config=config, return_exceptions=return_exceptions, **kwargs)
+        # Submit the whole batch as one unit of work: the queries run back to
+        # back on the dedicated Prolog thread (one engine session) instead of
+        # paying a thread hop per query
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _PROLOG_EXECUTOR,
+            partial(self.batch, inputs, config, return_exceptions=return_exceptions, **kwargs),
+        )
 
     def batch_as_completed(
         self,
@@ -703,5 +889,16 @@ class PrologRunnable(Runnable[PrologInput, PrologResult]):
             PrologValueError: If inputs is not a list
             PrologRuntimeError: If execution fails and return_exceptions is False
         """
-        for result in self.batch_as_completed(inputs, config=config, return_exceptions=return_exceptions, **kwargs):
-            yield result
+        # Drive the sync generator from the dedicated Prolog thread, one
+        # next() per step, so queries never block the event loop and results
+        # are surfaced as soon as each query finishes instead of wrapping
+        # every input in its own Task
+        loop = asyncio.get_running_loop()
+        iterator = self.batch_as_completed(inputs, config=config, return_exceptions=return_exceptions, **kwargs)
+        while True:
+            # Results are always (index, result) tuples, so None is a safe
+            # end-of-iteration sentinel
+            item = await loop.run_in_executor(_PROLOG_EXECUTOR, next, iterator, None)
+            if item is None:
+                return
+            yield item
@@ -155,6 +155,11 @@ class PrologTool(Tool):
         Raises:
             PrologToolException: If the query execution fails
         """
-        if run_manager:
-            run_manager = run_manager.get_sync()  # type: ignore
-        return self._run(*args, config=config, run_manager=run_manager, **kwargs)  # type: ignore
+        try:
+            if run_manager and signature(self.prolog.ainvoke).parameters.get("callbacks"):
+                kwargs["callbacks"] = run_manager.get_child()
+            if config_param := _get_runnable_config_param(self.prolog.ainvoke):
+                kwargs[config_param] = config
+            return await self.prolog.ainvoke(*args, **kwargs)
+        except Exception as e:
+            raise PrologToolException(f"Unexpected error during Prolog tool execution: {str(e)}")
@@ -0,0 +1,29 @@
+"""Shared pytest configuration for the langchain-prolog test suite."""
+
+import asyncio
+
+import pytest
+
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.fixture
+    def event_loop():
+        """Run async tests on a uvloop event loop to cut per-await overhead."""
+        loop = uvloop.new_event_loop()
+        yield loop
+        loop.close()
+
+else:
+
+    @pytest.fixture
+    def event_loop():
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
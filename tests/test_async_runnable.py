@@ -12,19 +12,17 @@ from langchain_prolog import (
     PrologValueError,
 )
 
-import importlib
-import langchain_prolog
-
-# Force reload after changes
-importlib.reload(langchain_prolog)
-
 # Get the path to the test directory
 TEST_DIR = Path(__file__).parent / "test_scripts"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def prolog_runnable():
-    """Create a PrologRunnable instance with test rules."""
+    """Create a PrologRunnable instance with test rules.
+
+    Module-scoped so family.pl is consulted once for the whole file: every
+    test here only queries the knowledge base, never mutates it.
+    """
     SolveArgs = PrologRunnable.create_schema(predicate_name="partner", arg_names=["X", "Y"])
     config = PrologConfig(
         rules_file=TEST_DIR / "family.pl",
@@ -36,19 +34,19 @@ def prolog_runnable():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runnable_no_default():
     config = PrologConfig(rules_file=TEST_DIR / "family.pl")
     return PrologRunnable(prolog_config=config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runnable_zero_arity():
     config = PrologConfig(rules_file=TEST_DIR / "family.pl", default_predicate="hello")
     return PrologRunnable(prolog_config=config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def solve_args():
     """Create the schema for partner/2 predicate."""
     return PrologRunnable.create_schema(predicate_name="partner", arg_names=["X", "Y"])
@@ -311,6 +309,7 @@ async def test_malformed_predicate_syntax(runnable_no_default):
     assert "Mismatched parentheses in query" in str(exc_info.value)
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_missing_rules_file():
     """Test initialization with non-existent rules file."""
@@ -319,6 +318,7 @@ async def test_missing_rules_file():
     assert "Prolog rules file not found" in str(exc_info.value)
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_invalid_prolog_syntax(tmp_path):
     """Test loading rules with invalid Prolog syntax."""
@@ -410,6 +410,7 @@ async def test_schema_with_empty_args():
     assert len(schema.model_fields) == 0
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_multiple_rule_files(tmp_path):
     """Test loading multiple rule files."""
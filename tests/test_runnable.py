@@ -12,101 +12,97 @@ from langchain_prolog import (
     PrologValueError,
 )
 
-import importlib
-import langchain_prolog
-
-# Force reload after changes
-importlib.reload(langchain_prolog)
-
 # Get the path to the test directory
 TEST_DIR = Path(__file__).parent / "test_scripts"
 
+# Shared schema for partner/2, built once at import instead of per fixture call
+PARTNER_SCHEMA = PrologRunnable.create_schema(predicate_name="partner", arg_names=["X", "Y"])
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def prolog_runnable():
-    """Create a PrologRunnable instance with test rules."""
-    SolveArgs = PrologRunnable.create_schema(predicate_name="partner", arg_names=["X", "Y"])
+    """Create a PrologRunnable instance with test rules.
+
+    Module-scoped so family.pl is consulted once for the whole file: every
+    test here only queries the knowledge base, never mutates it.
+    """
     config = PrologConfig(
         rules_file=TEST_DIR / "family.pl",
         default_predicate="partner",
-        query_schema=SolveArgs,
+        query_schema=PARTNER_SCHEMA,
     )
     return PrologRunnable(
         prolog_config=config,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runnable_no_default():
     config = PrologConfig(rules_file=TEST_DIR / "family.pl")
     return PrologRunnable(prolog_config=config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runnable_zero_arity():
     config = PrologConfig(rules_file=TEST_DIR / "family.pl", default_predicate="hello")
     return PrologRunnable(prolog_config=config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def solve_args():
-    """Create the schema for partner/2 predicate."""
-    return PrologRunnable.create_schema(predicate_name="partner", arg_names=["X", "Y"])
+    """Provide the shared schema for the partner/2 predicate."""
+    return PARTNER_SCHEMA
 
 
-def test_invoke_all_solutions(prolog_runnable):
-    """Test invoke with query that returns all solutions."""
-    result = prolog_runnable.invoke({"X": None, "Y": None})
-    assert isinstance(result, list)
-    assert len(result) == 3
-    assert result[0] == {"X": "john", "Y": "bianca"}
-    assert result[1] == {"X": "john", "Y": "bianca"}
-    assert result[2] == {"X": "peter", "Y": "patricia"}
-
-
-def test_invoke_filtered_solutions(prolog_runnable):
-    """Test invoke with query that returns filtered solutions."""
-    result = prolog_runnable.invoke("john, Y")
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+@pytest.fixture(scope="module")
+def batch_inputs(solve_args) -> list[PrologInput]:
+    """Standard six-query batch shared by the batch tests; never mutated."""
+    return [
+        {"X": None, "Y": None},
+        "john, Y",
+        solve_args.model_construct(X=None, Y=None),
+        "john, bianca",
+        "john, patricia",
+        "peter, patricia",
+    ]
 
 
-def test_invoke_with_model(prolog_runnable, solve_args):
-    """Test invoke with Pydantic model input."""
-    args = solve_args(X=None, Y=None)
-    result = prolog_runnable.invoke(args)
-    assert isinstance(result, list)
-    assert len(result) == 3
-    assert result[0] == {"X": "john", "Y": "bianca"}
-    assert result[1] == {"X": "john", "Y": "bianca"}
-    assert result[2] == {"X": "peter", "Y": "patricia"}
-
-
-def test_full_predicate_query(prolog_runnable):
-    """Test using full predicate syntax."""
-    result = prolog_runnable.invoke("partner(john, Y)")
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
-
-
-def test_invoke_true_result(prolog_runnable):
-    """Test invoke with query that returns multiple True."""
-    result = prolog_runnable.invoke("john, bianca")
-    assert result is True
+# Solution bindings for an unbound partner/2 query, in generation order
+ALL_PARTNER_BINDINGS = [
+    {"X": "john", "Y": "bianca"},
+    {"X": "john", "Y": "bianca"},
+    {"X": "peter", "Y": "patricia"},
+]
 
 
-def test_invoke_false_result(prolog_runnable):
-    """Test invoke with query that returns False."""
-    result = prolog_runnable.invoke("john, patricia")
-    assert result is False
+def test_invoke_all_solutions(prolog_runnable):
+    """Test invoke with query that returns all solutions."""
+    assert prolog_runnable.invoke({"X": None, "Y": None}) == ALL_PARTNER_BINDINGS
 
 
-def test_invoke_single_solution(prolog_runnable):
-    """Test invoke with query that returns a single solution."""
-    result = prolog_runnable.invoke("peter, patricia")
-    assert result is True
+def test_invoke_with_model(prolog_runnable, solve_args):
+    """Test invoke with Pydantic model input."""
+    args = solve_args.model_construct(X=None, Y=None)
+    assert prolog_runnable.invoke(args) == ALL_PARTNER_BINDINGS
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("john, Y", [{"Y": "bianca"}] * 2),  # filtered solutions
+        ("partner(john, Y)", [{"Y": "bianca"}] * 2),  # full predicate syntax
+        ("john, bianca", True),  # grounded query that succeeds
+        ("john, patricia", False),  # grounded query that fails
+        ("peter, patricia", True),  # single solution
+    ],
+)
+def test_invoke_cases(prolog_runnable, query, expected):
+    """Test invoke across grounded and solution-returning queries."""
+    result = prolog_runnable.invoke(query)
+    if expected is True or expected is False:
+        assert result is expected
+    else:
+        assert result == expected
 
 
 def test_zero_arity_predicate(runnable_no_default):
@@ -123,84 +119,56 @@ def test_zero_arity_default_predicate(runnable_zero_arity):
     assert result is True
 
 
-def test_stream_all_solutions(prolog_runnable):
-    """Test stream with query that returns all solutions."""
-    results = list(prolog_runnable.stream({"X": None, "Y": None}))
-    assert len(results) == 3
-    assert results[0] == [{"X": "john", "Y": "bianca"}]
-    assert results[1] == [{"X": "john", "Y": "bianca"}]
-    assert results[2] == [{"X": "peter", "Y": "patricia"}]
+# Streamed solutions for an unbound partner/2 query: one single-binding
+# chunk per solution, in generation order
+ALL_PARTNER_SOLUTIONS = tuple([binding] for binding in ALL_PARTNER_BINDINGS)
 
 
-def test_stream_filtered_solutions(prolog_runnable):
-    """Test stream with query that returns filtered solutions."""
-    results = list(prolog_runnable.stream("john, Y"))
-    assert len(results) == 2
-    assert all(sol == [{"Y": "bianca"}] for sol in results)
+def test_stream_all_solutions(prolog_runnable):
+    """Test stream with query that returns all solutions."""
+    count = 0
+    for i, result in enumerate(prolog_runnable.stream({"X": None, "Y": None})):
+        assert result == ALL_PARTNER_SOLUTIONS[i]
+        count = i + 1
+    assert count == len(ALL_PARTNER_SOLUTIONS)
 
 
 def test_stream_with_model(prolog_runnable, solve_args):
     """Test stream with Pydantic model input."""
-    args = solve_args(X=None, Y=None)
-    results = list(prolog_runnable.stream(args))
-    assert len(results) == 3
-    assert results[0] == [{"X": "john", "Y": "bianca"}]
-    assert results[1] == [{"X": "john", "Y": "bianca"}]
-    assert results[2] == [{"X": "peter", "Y": "patricia"}]
-
-
-def test_stream_full_predicate(prolog_runnable):
-    """Test streaming with full predicate syntax."""
-    results = list(prolog_runnable.stream("partner(john, Y)"))
-    assert len(results) == 2
-    assert all(isinstance(r, list) and len(r) == 1 for r in results)
-    assert all(r[0]["Y"] == "bianca" for r in results)
-
-
-def test_stream_true_result(prolog_runnable):
-    """Test stream with query that returns True."""
-    results = list(prolog_runnable.stream("john, bianca"))
-    assert len(results) == 1
-    assert results[0] is True
-
-
-def test_stream_false_result(prolog_runnable):
-    """Test stream with query that returns False."""
-    results = list(prolog_runnable.stream("john, patricia"))
-    assert len(results) == 1
-    assert results[0] is False
-
-
-def test_stream_single_solution(prolog_runnable):
-    """Test stream with query that returns a single solution."""
-    results = list(prolog_runnable.stream("peter, patricia"))
-    assert len(results) == 1
-    assert results[0] is True
+    args = solve_args.model_construct(X=None, Y=None)
+    count = 0
+    for i, result in enumerate(prolog_runnable.stream(args)):
+        assert result == ALL_PARTNER_SOLUTIONS[i]
+        count = i + 1
+    assert count == len(ALL_PARTNER_SOLUTIONS)
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("john, Y", [[{"Y": "bianca"}]] * 2),  # filtered solutions
+        ("partner(john, Y)", [[{"Y": "bianca"}]] * 2),  # full predicate syntax
+        ("john, bianca", [True]),  # grounded query that succeeds
+        ("john, patricia", [False]),  # grounded query that fails
+        ("peter, patricia", [True]),  # single solution
+    ],
+)
+def test_stream_cases(prolog_runnable, query, expected):
+    """Test stream across grounded and solution-returning queries."""
+    assert list(prolog_runnable.stream(query)) == expected
 
 
-def test_batch_processing(prolog_runnable, solve_args):
+def test_batch_processing(prolog_runnable, batch_inputs):
     """Test batch processing with various input types."""
-    batch_inputs: list[PrologInput] = [
-        {"X": None, "Y": None},
-        "john, Y",
-        solve_args(X=None, Y=None),
-        "john, bianca",
-        "john, patricia",
-        "peter, patricia",
+    assert prolog_runnable.batch(batch_inputs) == [
+        ALL_PARTNER_BINDINGS,  # all solutions
+        [{"Y": "bianca"}] * 2,  # john's solutions
+        ALL_PARTNER_BINDINGS,  # all solutions via model
+        True,  # true result
+        False,  # false result
+        True,  # single solution
     ]
 
-    results = prolog_runnable.batch(batch_inputs)
-    assert len(results) == 6
-    assert isinstance(results[0], list)  # All solutions
-    assert len(results[0]) == 3
-    assert isinstance(results[1], list)  # john's solutions
-    assert len(results[1]) == 2
-    assert isinstance(results[2], list)  # All solutions via model
-    assert len(results[2]) == 3
-    assert results[3] is True  # True result
-    assert results[4] is False  # False result
-    assert results[5] is True  # Single solution
-
 
 def test_mixed_predicate_styles(prolog_runnable):
     """Test mixing full and default predicate styles in batch."""
@@ -220,79 +188,63 @@ def test_mixed_batch_with_none(runnable_zero_arity):
         "partner(john, Y)",  # full predicate
         "hello()",  # zero-arity explicit
     ]
-    results = runnable_zero_arity.batch(batch_inputs)
-    assert len(results) == 3
-    assert results[0] is True  # hello() succeeds
-    assert isinstance(results[1], list)  # partner query returns solutions
-    assert results[2] is True  # hello() succeeds
+    assert runnable_zero_arity.batch(batch_inputs) == [
+        True,  # hello() succeeds
+        [{"Y": "bianca"}] * 2,  # partner query returns solutions
+        True,  # hello() succeeds
+    ]
 
 
-def test_batch_as_completed(prolog_runnable, solve_args):
+def test_batch_as_completed(prolog_runnable, batch_inputs):
     """Test batch processing with various input types."""
-    batch_inputs: list[PrologInput] = [
-        {"X": None, "Y": None},
-        "john, Y",
-        solve_args(X=None, Y=None),
-        "john, bianca",
-        "john, patricia",
-        "peter, patricia",
+    assert list(prolog_runnable.batch_as_completed(batch_inputs)) == [
+        (0, ALL_PARTNER_BINDINGS),  # all solutions
+        (1, [{"Y": "bianca"}] * 2),  # john's solutions
+        (2, ALL_PARTNER_BINDINGS),  # all solutions via model
+        (3, True),  # true result
+        (4, False),  # false result
+        (5, True),  # single solution
     ]
 
-    results = list(prolog_runnable.batch_as_completed(batch_inputs))
-    assert len(results) == 6
-    assert isinstance(results[0][1], list)  # All solutions
-    assert len(results[0][1]) == 3
-    assert isinstance(results[1][1], list)  # john's solutions
-    assert len(results[1][1]) == 2
-    assert isinstance(results[2][1], list)  # All solutions via model
-    assert len(results[2][1]) == 3
-    assert results[3][1] is True  # True result
-    assert results[4][1] is False  # False result
-    assert results[5][1] is True  # Single solution
-
 
 def test_no_default_predicate(runnable_no_default):
     """Test using argument-style query without default predicate."""
-    with pytest.raises(PrologValueError) as exc_info:
+    with pytest.raises(PrologValueError, match="No default predicate set"):
         runnable_no_default.invoke("john, Y")
-    assert "No default predicate set" in str(exc_info.value)
 
 
 def test_none_input_without_default_predicate(runnable_no_default):
     """Test None input without default predicate."""
-    with pytest.raises(PrologValueError) as exc_info:
+    with pytest.raises(PrologValueError, match="Input data cannot be None"):
         runnable_no_default.invoke(None)
-    assert "Input data cannot be None" in str(exc_info.value)
 
 
 def test_invalid_full_predicate(runnable_no_default):
     """Test invalid full predicate syntax."""
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog execution error"):
         runnable_no_default.invoke("invalid_predicate(X, Y)")
-    assert "Prolog execution error" in str(exc_info.value)
 
 
 def test_invalid_arity_full_predicate(runnable_no_default):
     """Test full predicate with wrong number of arguments."""
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog execution error"):
         runnable_no_default.invoke("partner(X, Y, Z)")  # partner is binary
-    assert "Prolog execution error" in str(exc_info.value)
 
 
 def test_malformed_predicate_syntax(runnable_no_default):
     """Test malformed predicate syntax."""
-    with pytest.raises(PrologValueError) as exc_info:
+    with pytest.raises(PrologValueError, match="Mismatched parentheses in query"):
         runnable_no_default.invoke("partner(X, Y")  # Missing closing parenthesis
-    assert "Mismatched parentheses in query" in str(exc_info.value)
 
 
+@pytest.mark.slow
 def test_missing_rules_file():
     """Test initialization with non-existent rules file."""
-    with pytest.raises(PrologFileNotFoundError) as exc_info:
+    with pytest.raises(PrologFileNotFoundError, match="Prolog rules file not found"):
         PrologRunnable({"rules_file": "nonexistent.pl"})
-    assert "Prolog rules file not found" in str(exc_info.value)
 
 
+@pytest.mark.slow
 def test_invalid_prolog_syntax(tmp_path):
     """Test loading rules with invalid Prolog syntax."""
     invalid_rules = tmp_path / "invalid.pl"
@@ -305,22 +257,19 @@ def test_invalid_prolog_syntax(tmp_path):
 
 def test_invalid_input_type(prolog_runnable):
     """Test invoke with invalid input type."""
-    with pytest.raises(PrologValueError) as exc_info:
+    with pytest.raises(PrologValueError, match="Invalid input type"):
         prolog_runnable.invoke(123)  # type: ignore
-    assert "Invalid input type" in str(exc_info.value)
 
 
 def test_dict_input_without_schema(runnable_no_default):
-    with pytest.raises(PrologValueError) as exc_info:
+    with pytest.raises(PrologValueError, match="missing schema"):
         runnable_no_default.invoke({"X": None, "Y": None})
-    assert "missing schema" in str(exc_info.value)
 
 
 def test_invalid_prolog_query(prolog_runnable):
     """Test with a query that causes a Prolog execution error."""
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog execution error"):
         prolog_runnable.invoke("invalid_predicate(X)")
-    assert "Prolog execution error" in str(exc_info.value)
 
 
 # Schema creation tests
@@ -341,9 +290,8 @@ def test_batch_with_mixed_valid_invalid(prolog_runnable):
         "john, Y",  # valid
     ]
 
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog batch execution error"):
         prolog_runnable.batch(batch_inputs)  # type: ignore
-    assert "Prolog batch execution error" in str(exc_info.value)
 
 
 def test_empty_batch(prolog_runnable):
@@ -354,17 +302,15 @@ def test_empty_batch(prolog_runnable):
 # Stream error handling
 def test_stream_error_handling(prolog_runnable):
     """Test stream method error handling."""
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog execution error"):
         list(prolog_runnable.stream("invalid_predicate(X)"))
-    assert "Prolog execution error" in str(exc_info.value)
 
 
 # Edge cases
 def test_invoke_with_empty_string_no_matching_arity(prolog_runnable):
     """Test invoke with empty string."""
-    with pytest.raises(PrologRuntimeError) as exc_info:
+    with pytest.raises(PrologRuntimeError, match="Prolog execution error"):
         prolog_runnable.invoke("")
-    assert "Prolog execution error" in str(exc_info.value)
 
 
 def test_schema_with_empty_args():
@@ -374,6 +320,7 @@ def test_schema_with_empty_args():
     assert len(schema.model_fields) == 0
 
 
+@pytest.mark.slow
 def test_multiple_rule_files(tmp_path):
     """Test loading multiple rule files."""
     # Create two rule files
@@ -393,6 +340,49 @@ def test_multiple_rule_files(tmp_path):
     assert runnable.invoke("b") is True
 
 
+def test_rules_text():
+    """Test loading rules from an in-memory string."""
+    runnable = PrologRunnable(PrologConfig(rules_text="likes(mary, wine).", default_predicate="likes"))
+    assert runnable.invoke("mary, wine") is True
+    assert runnable.invoke("mary, beer") is False
+
+
+def test_cache_failed_queries():
+    """Test that failed goals are cached and cleared when rules load."""
+    config = PrologConfig(rules_file=TEST_DIR / "family.pl", cache_failed_queries=True)
+    runnable = PrologRunnable(prolog_config=config)
+
+    query = "partner(john, nobody)"
+    assert runnable.invoke(query) is False
+    assert query in runnable._failed_queries
+
+    # The repeated failing query is answered from the cache
+    assert runnable.invoke(query) is False
+
+    # Re-consulting the rules file clears the cached failures
+    runnable.load_rules(TEST_DIR / "family.pl", force=True)
+    assert not runnable._failed_queries
+
+    # Loading in-memory rules clears them as well, so new facts are seen
+    assert runnable.invoke(query) is False
+    runnable.load_rules_text("new_partner_fact(found).")
+    assert not runnable._failed_queries
+    assert runnable.invoke("new_partner_fact(found)") is True
+
+
+def test_cache_failed_queries_bypassed_with_prolog_kwargs():
+    """Test that per-call prolog_kwargs skip the failed-query cache."""
+    config = PrologConfig(rules_file=TEST_DIR / "family.pl", cache_failed_queries=True)
+    runnable = PrologRunnable(prolog_config=config)
+
+    query = "partner(john, Partner)"
+    bindings_config = {"configurable": {"prolog_kwargs": {"inputs": {"Partner": "nobody"}}}}
+    assert runnable.invoke(query, config=bindings_config) is False
+    # The binding-dependent failure is not cached against the bare goal
+    assert query not in runnable._failed_queries
+    assert runnable.invoke(query) == [{"Partner": "bianca"}, {"Partner": "bianca"}]
+
+
 def test_config_handling(prolog_runnable):
     """Test that config parameter is accepted but not affecting execution."""
     result1 = prolog_runnable.invoke("john, Y")
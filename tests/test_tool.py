@@ -1,9 +1,12 @@
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Iterator,
+)
 from pathlib import Path
 from typing import (
     Any,
-    AsyncIterator,
     Dict,
-    Iterator,
 )
 
 import pytest
@@ -21,23 +24,84 @@ from langchain_prolog import (
     ValidationError,
 )
 
-import importlib
-import langchain_prolog
-
-# Force reload after changes
-importlib.reload(langchain_prolog)
-
 
 # Get the path to the test directory
 TEST_DIR = Path(__file__).parent / "test_scripts"
+FAMILY_PL = TEST_DIR / "family.pl"
+
+# Solutions for john's partner queries, compared with a single list equality
+JOHN_PARTNER_SOLUTIONS = [{"Y": "bianca"}, {"Y": "bianca"}]
+
+# Shared schemas, built once at import instead of per fixture call
+PARTNER_SCHEMA = PrologRunnable.create_schema("partner", ["X", "Y"])
+HELLO_SCHEMA = PrologRunnable.create_schema("hello", [])
+
+
+def family_config(**kwargs: Any) -> PrologConfig:
+    """Build a PrologConfig over family.pl.
+
+    Not cached: prolog_flags and other dict-valued kwargs are unhashable,
+    and the repeated consult is already skipped library-side for an
+    unchanged rules file.
+    """
+    return PrologConfig(rules_file=FAMILY_PL, **kwargs)
+
+
+class RecordingCallback(BaseCallbackHandler):
+    """Record on_tool_start invocations on instance attributes."""
+
+    def __init__(self) -> None:
+        self.called = False
+        self.input_str: str | None = None
+
+    def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
+        self.called = True
+        self.input_str = input_str
+
+
+class RecordingAsyncCallback(BaseCallbackHandler):
+    """Async counterpart of RecordingCallback."""
+
+    def __init__(self) -> None:
+        self.called = False
+        self.input_str: str | None = None
+
+    async def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
+        self.called = True
+        self.input_str = input_str
+
+
+class VerboseCallback(BaseCallbackHandler):
+    """Capture tool start/end events for the verbose-mode test."""
+
+    def __init__(self) -> None:
+        self.output_captured: list[str] = []
+
+    def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
+        self.output_captured.append(f"Starting: {input_str}")
 
+    def on_tool_end(self, output: str, **kwargs: Any) -> None:
+        self.output_captured.append(f"Ending: {output}")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
+def batch_queries():
+    """Shared batch inputs: a multi-solution query, a true goal and an error."""
+    return [
+        "partner(john, Y)",
+        "partner(peter, patricia)",
+        "invalid_query",
+    ]
+
+
+@pytest.fixture(scope="module")
 def prolog_tool():
-    config = PrologConfig(
-        rules_file=TEST_DIR / "family.pl",
-        default_predicate="partner",
-    )
+    """Shared family-query tool.
+
+    Module-scoped so family.pl is consulted once for the whole file: every
+    test using it only queries the knowledge base, never mutates tool state.
+    """
+    config = family_config(default_predicate="partner")
     return PrologTool(
         name="family_query",
         description="""Query family relationships using Prolog. Input can be a query string like 'parent(john, X, Y)'
@@ -46,14 +110,9 @@ def prolog_tool():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def prolog_tool_with_schema():
-    schema = PrologRunnable.create_schema("partner", ["X", "Y"])
-    config = PrologConfig(
-        rules_file=TEST_DIR / "family.pl",
-        default_predicate="partner",
-        query_schema=schema,
-    )
+    config = family_config(default_predicate="partner", query_schema=PARTNER_SCHEMA)
     return PrologTool(
         name="family_query",
         description="""Query family relationships using Prolog. Input can be a query string like 'parent(john, X, Y)'
@@ -62,15 +121,10 @@ def prolog_tool_with_schema():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def zero_arity_tool():
     """Create a tool with zero-arity predicate."""
-    schema = PrologRunnable.create_schema("hello", [])
-    config = PrologConfig(
-        rules_file=TEST_DIR / "family.pl",
-        default_predicate="hello",
-        query_schema=schema,
-    )
+    config = family_config(default_predicate="hello", query_schema=HELLO_SCHEMA)
     return PrologTool(
         name="zero_arity",
         description="Test zero-arity predicates",
@@ -90,50 +144,34 @@ def test_tool_run(prolog_tool, prolog_tool_with_schema):
     """Test running the tool with various inputs."""
     # Test with string query
     result = prolog_tool.run("john, Y")
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+    assert result == JOHN_PARTNER_SOLUTIONS
 
     # Test with full predicate
     result = prolog_tool.run("partner(john, Y)")
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+    assert result == JOHN_PARTNER_SOLUTIONS
 
     # Test with dictionary input
     result = prolog_tool_with_schema.run({"X": "john", "Y": None})
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+    assert result == JOHN_PARTNER_SOLUTIONS
 
     # Test with pedantic object input
-    args = prolog_tool_with_schema.prolog.prolog_config.query_schema(X="john", Y=None)
+    args = PARTNER_SCHEMA(X="john", Y=None)
     result = prolog_tool_with_schema.run(args)
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+    assert result == JOHN_PARTNER_SOLUTIONS
 
 
-def test_tool_arun(prolog_tool):
+@pytest.mark.asyncio
+async def test_tool_arun(prolog_tool):
     """Test running the tool asynchronously."""
-    import asyncio
-
-    async def async_test():
-        result = await prolog_tool.arun("john, Y")
-        assert isinstance(result, list)
-        assert len(result) == 2
-        assert all(sol == {"Y": "bianca"} for sol in result)
-
-    asyncio.run(async_test())
+    result = await prolog_tool.arun("john, Y")
+    assert result == JOHN_PARTNER_SOLUTIONS
 
 
 def test_schema_validation(prolog_tool_with_schema):
     """Test tool with schema validation."""
     # Test with valid dict input
     result = prolog_tool_with_schema.run({"X": "john", "Y": None})
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(sol == {"Y": "bianca"} for sol in result)
+    assert result == JOHN_PARTNER_SOLUTIONS
 
     # Test with invalid dict input
     with pytest.raises(ValidationError):
@@ -142,55 +180,34 @@ def test_schema_validation(prolog_tool_with_schema):
 
 def test_tool_error_handling(prolog_tool):
     """Test error handling in the tool."""
-    # Test with invalid predicate
-    with pytest.raises(ToolException):
-        prolog_tool.run("invalid_predicate(X)")
-
-    # Test with incorrect arity
-    with pytest.raises(ToolException):
-        prolog_tool.run("partner(X, Y, Z)")
-
-    # Test with syntax error
-    with pytest.raises(ToolException):
-        prolog_tool.run("partner(X, Y")
-
-
-def test_tool_with_different_configs():
+    queries = [
+        "invalid_predicate(X)",  # invalid predicate
+        "partner(X, Y, Z)",  # incorrect arity
+        "partner(X, Y",  # syntax error
+    ]
+    results = prolog_tool.batch(queries, return_exceptions=True)
+    assert len(results) == 3
+    assert all(isinstance(result, ToolException) for result in results)
+
+
+@pytest.mark.parametrize(
+    "config_kwargs",
+    [
+        {},  # minimal config
+        {"default_predicate": "partner"},
+        {"query_schema": PARTNER_SCHEMA},
+        {"prolog_flags": {"debug": "true"}},
+    ],
+    ids=["minimal", "default_predicate", "query_schema", "prolog_flags"],
+)
+def test_tool_with_different_configs(config_kwargs):
     """Test tool initialization with different configurations."""
-    # Test with minimal config
-    minimal_tool = PrologTool(
-        name="minimal",
-        description="Minimal tool",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
-    )
-    assert minimal_tool.prolog is not None
-
-    # Test with default predicate
-    default_predicate_tool = PrologTool(
-        name="minimal",
-        description="Minimal tool",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl", default_predicate="partner"),
-    )
-    assert default_predicate_tool.prolog is not None
-
-    # Test with input schema
-    schema = PrologRunnable.create_schema("partner", ["X", "Y"])
-    input_schema_tool = PrologTool(
+    tool = PrologTool(
         name="minimal",
         description="Minimal tool",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl", query_schema=schema),
+        prolog_config=family_config(**config_kwargs),
     )
-    assert input_schema_tool.prolog is not None
-
-    # Test with custom flags
-    custom_tool = PrologTool(
-        name="custom",
-        description="Custom tool",
-        prolog_config=PrologConfig(
-            rules_file=TEST_DIR / "family.pl", prolog_flags={"debug": "true"}
-        ),
-    )
-    assert custom_tool.prolog is not None
+    assert tool.prolog is not None
 
 
 def test_tool_invalid_initialization():
@@ -212,7 +229,7 @@ def test_tool_invalid_initialization():
         PrologTool(
             name="invalid",
             description="Invalid tool",
-            prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+            prolog_config=family_config(),
             func=lambda x: x,
         )
 
@@ -223,7 +240,7 @@ def test_tool_response_format():
     tool = PrologTool(
         name="default",
         description="Default format",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+        prolog_config=family_config(),
         response_format="content",
     )
     result = tool.run("partner(john, Y)")
@@ -234,7 +251,7 @@ def test_tool_response_format():
         tool = PrologTool(
             name="default",
             description="Default format",
-            prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+            prolog_config=family_config(),
             response_format="content_and_artifact",
         )
         result = tool.run("partner(john, Y)")
@@ -245,52 +262,40 @@ def test_tool_response_format():
         PrologTool(
             name="invalid",
             description="Invalid format",
-            prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+            prolog_config=family_config(),
             response_format="invalid",
         )
 
 
 def test_tool_with_callbacks():
     """Test tool with callback handling."""
-    callback_called = False
-
-    class TestCallback(BaseCallbackHandler):
-        def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
-            nonlocal callback_called
-            callback_called = True
-            assert input_str == "john, Y"
-
+    callback = RecordingCallback()
     tool = PrologTool(
         name="callback_test",
         description="Test callbacks",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
-        callbacks=[TestCallback()],
+        prolog_config=family_config(),
+        callbacks=[callback],
     )
 
     tool.run("partner(john, Y)")
-    assert callback_called
+    assert callback.called
+    assert callback.input_str == "partner(john, Y)"
 
 
 @pytest.mark.asyncio
 async def test_tool_async_callbacks():
     """Test tool with async callback handling."""
-    callback_called = False
-
-    class TestAsyncCallback(BaseCallbackHandler):
-        async def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
-            nonlocal callback_called
-            callback_called = True
-            assert input_str == "partner(john, Y)"
-
+    callback = RecordingAsyncCallback()
     tool = PrologTool(
         name="async_callback_test",
         description="Test async callbacks",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
-        callbacks=[TestAsyncCallback()],
+        prolog_config=family_config(),
+        callbacks=[callback],
     )
 
     await tool.arun("partner(john, Y)")
-    assert callback_called
+    assert callback.called
+    assert callback.input_str == "partner(john, Y)"
 
 
 def test_tool_metadata():
@@ -299,7 +304,7 @@ def test_tool_metadata():
     tool = PrologTool(
         name="metadata_test",
         description="Test metadata",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+        prolog_config=family_config(),
         metadata=metadata,
     )
 
@@ -313,11 +318,11 @@ def test_tool_tags():
     tool = PrologTool(
         name="tags_test",
         description="Test tags",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+        prolog_config=family_config(),
         tags=tags,
     )
 
-    assert all(tag in tool.tags for tag in tags)
+    assert set(tags).issubset(tool.tags)
     assert "prolog" in tool.prolog.tags
 
 
@@ -337,23 +342,17 @@ def test_tool_result_types(prolog_tool):
     assert result is False
 
 
-def test_tool_zero_arity(zero_arity_tool):
-    """Test tool with zero-arity predicates."""
-    # Test with None input. Requires query_schema definition.
-    result = zero_arity_tool.run(None)
-    assert result is True
-
-    # Test with empty dictionary. Requires query_schema definition.
-    result = zero_arity_tool.run({})
-    assert result is True
-
-    # Test with empty string
-    result = zero_arity_tool.run("")
-    assert result is True
+@pytest.mark.parametrize(
+    "tool_input",
+    [None, {}, "", "hello()"],
+    ids=["none", "empty_dict", "empty_string", "explicit_predicate"],
+)
+def test_tool_zero_arity(zero_arity_tool, tool_input):
+    """Test tool with zero-arity predicates.
 
-    # Test with explicit predicate
-    result = zero_arity_tool.run("hello()")
-    assert result is True
+    The None and empty-dict inputs require the query_schema definition.
+    """
+    assert zero_arity_tool.run(tool_input) is True
 
 
 @pytest.mark.asyncio
@@ -363,73 +362,57 @@ async def test_tool_streaming(prolog_tool):
     # Test synchronous streaming
     stream_results = prolog_tool.stream("partner(X, Y)")
     assert isinstance(stream_results, Iterator)
-    results = list(stream_results)
-    assert len(results) > 0
+    first = next(stream_results, None)
+    assert first is not None
 
     # Test asynchronous streaming
     async_stream = prolog_tool.astream("partner(X, Y)")
     assert isinstance(async_stream, AsyncIterator)
-    async_results = [result async for result in async_stream]
-    assert len(async_results) > 0
+    first = await anext(async_stream, None)
+    assert first is not None
 
 
-def test_tool_batch_processing(prolog_tool):
+def test_tool_batch_processing(prolog_tool, batch_queries):
     """Test tool batch processing capabilities."""
-    queries = [
-        "john, Y",
-        "partner(peter, patricia)",
-        "invalid_query",
-    ]
-
     # Test with return_exceptions=True
-    results = prolog_tool.batch(queries, return_exceptions=True)
-    assert len(results) == 3
-    assert isinstance(results[0], list)  # Valid query
-    assert results[1] is True  # True result
+    results = prolog_tool.batch(batch_queries, return_exceptions=True)
+    assert results[:2] == [JOHN_PARTNER_SOLUTIONS, True]
     assert isinstance(results[2], ToolException)  # Error
 
     # Test with return_exceptions=False
     with pytest.raises(ToolException):
-        prolog_tool.batch(queries, return_exceptions=False)
+        prolog_tool.batch(batch_queries, return_exceptions=False)
 
 
 @pytest.mark.asyncio
-async def test_tool_async_batch(prolog_tool):
+async def test_tool_async_batch(prolog_tool, batch_queries):
     """Test tool async batch processing."""
-    queries = [
-        "partner(john, Y)",
-        "partner(peter, patricia)",
-    ]
+    results = await prolog_tool.abatch(batch_queries, return_exceptions=True)
+    assert results[:2] == [JOHN_PARTNER_SOLUTIONS, True]
+    assert isinstance(results[2], ToolException)
 
-    results = await prolog_tool.abatch(queries)
-    assert len(results) == 2
-    assert isinstance(results[0], list)
-    assert results[1] is True
+    # Concurrently dispatched arun calls serialize behind the runnable's
+    # dedicated Prolog thread and must match the batched results
+    gathered = await asyncio.gather(*(prolog_tool.arun(query) for query in batch_queries), return_exceptions=True)
+    assert gathered[:2] == results[:2]
+    assert isinstance(gathered[2], ToolException)
 
 
 def test_tool_verbose_mode():
     """Test tool in verbose mode."""
-    output_captured = []
-
-    class VerboseCallback(BaseCallbackHandler):
-        def on_tool_start(self, serialized: Dict, input_str: str, **kwargs: Any) -> None:
-            output_captured.append(f"Starting: {input_str}")
-
-        def on_tool_end(self, output: str, **kwargs: Any) -> None:
-            output_captured.append(f"Ending: {output}")
-
+    callback = VerboseCallback()
     tool = PrologTool(
         name="verbose_test",
         description="Test verbose mode",
-        prolog_config=PrologConfig(rules_file=TEST_DIR / "family.pl"),
+        prolog_config=family_config(),
         verbose=True,
-        callbacks=[VerboseCallback()],
+        callbacks=[callback],
     )
 
     tool.run("partner(john, Y)")
-    assert len(output_captured) == 2
-    assert "Starting: " in output_captured[0]
-    assert "Ending: " in output_captured[1]
+    assert len(callback.output_captured) == 2
+    assert "Starting: " in callback.output_captured[0]
+    assert "Ending: " in callback.output_captured[1]
 
 
 def test_tool_input_validation(prolog_tool, prolog_tool_with_schema):
@@ -458,28 +441,21 @@ def test_tool_input_validation(prolog_tool, prolog_tool_with_schema):
 def test_tool_error_propagation(prolog_tool):
     """Test how different types of errors are propagated."""
     # Test syntax error
-    with pytest.raises(ToolException) as exc_info:
+    with pytest.raises(ToolException, match=r"(?i)mismatched parentheses in query"):
         prolog_tool.run("partner(")
-    assert "mismatched parentheses in query" in str(exc_info.value).lower()
 
     # Test undefined predicate
-    with pytest.raises(ToolException) as exc_info:
+    with pytest.raises(ToolException, match=r"(?i)undefined_pred"):
         prolog_tool.run("undefined_pred(X)")
-    assert "undefined_pred" in str(exc_info.value).lower()
 
     # Test invalid arity
-    with pytest.raises(ToolException) as exc_info:
+    with pytest.raises(ToolException, match=r"(?i)there are definitions for"):
         prolog_tool.run("partner(X, Y, Z)")  # partner is binary
-    assert "there are definitions for" in str(exc_info.value).lower()
 
 
 def test_tool_config_inheritance():
     """Test tool configuration inheritance behavior."""
-    parent_config = PrologConfig(
-        rules_file=TEST_DIR / "family.pl",
-        default_predicate="partner",
-        prolog_flags={"debug": "true"},
-    )
+    parent_config = family_config(default_predicate="partner", prolog_flags={"debug": "true"})
 
     # Create tool with parent config
     tool = PrologTool(